@@ -4,11 +4,10 @@ import pandas as pd
 import math
 import datetime
 
-def get_subdirectories(root_path):
-    return [os.path.join(root_path, d) for d in os.listdir(root_path) if os.path.isdir(os.path.join(root_path, d))]
+# Same extensions the image mergers load, so image_count matches the grid they build
+IMG_EXTS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff')
 
-def calculate_grid_size(directory):
-    num_images = len([f for f in os.listdir(directory) if f.endswith('.jpg') or f.endswith('.png') or f.endswith('.tif')])
+def grid_size_for(num_images):
     sqrt_num_images = int(math.sqrt(num_images))
     for rows in range(sqrt_num_images, 0, -1):
         if num_images % rows == 0:
@@ -17,20 +16,22 @@ def calculate_grid_size(directory):
     return "1x1"
 
 def count_images(directory):
-    return len([f for f in os.listdir(directory) if f.endswith('.jpg') or f.endswith('.png') or f.endswith('.tif')])
+    with os.scandir(directory) as it:
+        return sum(1 for e in it if e.is_file() and e.name.lower().endswith(IMG_EXTS))
 
 def generate_excel_file(output_file, root_path, layout_file):
-    folders = get_subdirectories(root_path)
-    grid_sizes = [calculate_grid_size(folder) for folder in folders]
-    font_size_factors = [0.1] * len(folders)
-    image_counts = [count_images(folder) for folder in folders]
+    # One directory pass per folder; grid size is derived from the cached count
+    with os.scandir(root_path) as it:
+        subdirs = [e for e in it if e.is_dir()]
+    image_counts = {e.path: count_images(e.path) for e in subdirs}
+    folders = [e.path for e in subdirs]
 
     data = {
         'input_dir': folders,
-        'grid_size': grid_sizes,
-        'font_size_factor': font_size_factors,
-        'layout_file': [os.path.join(root_path, folder_name[2:6] + folder_name[7] + folder_name[9] + '.xlsx') for folder_name in os.listdir(root_path) if os.path.isdir(os.path.join(root_path, folder_name))],
-        'image_count': image_counts,
+        'grid_size': [grid_size_for(image_counts[folder]) for folder in folders],
+        'font_size_factor': [0.1] * len(folders),
+        'layout_file': [os.path.join(root_path, e.name[2:6] + e.name[7] + e.name[9] + '.xlsx') for e in subdirs],
+        'image_count': [image_counts[folder] for folder in folders],
         'output_dir': [root_path] * len(folders),
     }
 
@@ -0,0 +1,414 @@
+import os
+import queue
+import tempfile
+import functools
+import multiprocessing
+import argparse
+import numpy as np
+import pandas as pd
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn, TextColumn, BarColumn, TaskProgressColumn
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Tuple, Optional, List
+from dataclasses import dataclass
+
+# Set up logging with rich
+from rich.logging import RichHandler
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    handlers=[RichHandler(rich_tracebacks=True)]
+)
+
+# Pillow-SIMD versions carry a ".postN" suffix; its vectorised resize makes BICUBIC as cheap as BILINEAR
+PILLOW_SIMD = '.post' in PIL.__version__
+RESAMPLE = Image.BICUBIC if PILLOW_SIMD else Image.BILINEAR
+
+# Set in each worker process by _init_worker; progress updates are sent back to the parent
+_progress_queue = None
+
+IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.tif', '.tiff'})
+
+# libjpeg cannot encode images wider or taller than this
+JPEG_MAX_DIMENSION = 65500
+
+# Number of image loads kept in flight ahead of the one being consumed
+PREFETCH_DEPTH = 2
+
+
+def prefetch(func: Callable, items: Iterable, depth: int = PREFETCH_DEPTH) -> Iterator:
+    """Yield func(item) in order while the next `depth` calls run in background threads."""
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) > depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@dataclass
+class ImageProcessingTask:
+    input_dir: str
+    output_dir: str
+    grid_size: Tuple[int, int]
+    font_size_factor: float
+    custom_names: pd.DataFrame
+    index: int
+    total: int
+    output_format: str = 'jpeg'
+
+
+class ImageProcessor:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def convert_16bit_to_8bit(image: Image.Image) -> Image.Image:
+        # Keep the high byte of each sample: one integer shift instead of a float LUT
+        arr = np.asarray(image, dtype=np.uint16) >> 8
+        return Image.fromarray(arr.astype(np.uint8)).convert('RGB')
+
+    def load_image(self, filepath: str, draft_size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
+        try:
+            # Image.open reads lazily from the path; the conversion decodes into a
+            # new image that stays valid after the file is closed
+            with Image.open(filepath) as image:
+                if draft_size and image.format == 'JPEG':
+                    # libjpeg scales by 1/2, 1/4 or 1/8 in the IDCT while staying >= draft_size
+                    image.draft('RGB', draft_size)
+                if image.mode == 'I;16':
+                    return self.convert_16bit_to_8bit(image)
+                return image.convert('RGB')
+
+        except OSError as e:
+            self.logger.error(f"OS Error loading image '{filepath}': {str(e)}")
+            if hasattr(e, 'errno'):
+                self.logger.error(f"Error number: {e.errno}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error loading image '{filepath}': {str(e)}")
+            return None
+
+    @staticmethod
+    def resize_images(images: List[Image.Image], size: Tuple[int, int]) -> List[Image.Image]:
+        # Use BILINEAR (BICUBIC on Pillow-SIMD) resampling instead of LANCZOS for better speed
+        # Tiles that already match are passed through untouched
+        return [img if img.size == size else img.resize(size, RESAMPLE) for img in images if img is not None]
+
+    @staticmethod
+    def draw_text(draw: ImageDraw.Draw, text: str, position: Tuple[int, int], font: ImageFont.FreeTypeFont):
+        # Drawn into the label mask: 255 is full coverage
+        draw.text(position, text, font=font, fill=255, anchor='la')
+
+    def create_image_grid(self, task: ImageProcessingTask) -> None:
+        _report(task, advance=10, description="Loading images...")
+
+        images = []
+        filenames = []
+
+        # Load and filter images; DirEntry carries the file type, so no per-file stat
+        with os.scandir(task.input_dir) as it:
+            entries = [e for e in it if e.is_file() and os.path.splitext(e.name)[1].lower() in IMG_EXTS]
+        entries.sort(key=lambda e: e.name)
+
+        # The first readable image fixes the tile size
+        remaining = iter(entries)
+        for entry in remaining:
+            image = self.load_image(entry.path)
+            if image:
+                images.append(image)
+                filenames.append(entry.name)
+                break
+
+        # Reads and decodes of the next files overlap with handling the current one;
+        # oversized JPEGs are decoded straight down towards the tile size
+        remaining = list(remaining)
+        loader = functools.partial(self.load_image, draft_size=images[0].size if images else None)
+        for entry, image in zip(remaining, prefetch(loader, (e.path for e in remaining))):
+            if image:
+                images.append(image)
+                filenames.append(entry.name)
+
+        if not images:
+            self.logger.warning("No valid images found in the input directory.")
+            _report(task, completed=100)
+            return
+
+        _report(task, advance=20, description="Resizing images...")
+
+        # Process images
+        size = images[0].size
+        images = self.resize_images(images, size)
+
+        # The grid lives in a memory-mapped temp file rather than RAM, so very large
+        # grids can be paged out while they are filled and encoded
+        fd, buf_path = tempfile.mkstemp(prefix='grid_', suffix='.buf')
+        os.close(fd)
+        try:
+            output_file = self._render_grid(task, images, filenames, size, buf_path)
+        finally:
+            try:
+                os.remove(buf_path)
+            except OSError as e:
+                self.logger.warning(f"Could not remove temporary grid buffer '{buf_path}': {str(e)}")
+
+        _report(task, advance=10, completed=True, description="Complete!")
+
+        self.logger.info(f"Grid image saved to {output_file}")
+
+    def _render_grid(self, task: ImageProcessingTask, images: List[Image.Image], filenames: List[str],
+                     size: Tuple[int, int], buf_path: str) -> Path:
+        grid_width = size[0] * task.grid_size[0]
+        grid_height = size[1] * task.grid_size[1]
+        # RGBX keeps rows 4-byte aligned, which lets Pillow map the buffer without copying it
+        buf = np.memmap(buf_path, dtype=np.uint8, mode='w+', shape=(grid_height, grid_width, 4))
+        # Every view of the mapping is dropped before returning, even on error: the caller
+        # deletes the file next, and Windows refuses to delete a file that is still mapped
+        region = grid_image = None
+        try:
+            buf[...] = 255
+
+            _report(task, advance=20, description="Creating grid...")
+
+            # Setup font
+            font = _get_font(int(size[1] * task.font_size_factor))
+
+            _report(task, advance=20, description="Adding images and labels...")
+
+            # Arrange images in grid
+            labels = []
+            for i in range(task.grid_size[1]):
+                for j in range(task.grid_size[0]):
+                    index = i * task.grid_size[0] + j
+                    if index < len(images):
+                        x, y = j * size[0], i * size[1]
+                        buf[y:y + size[1], x:x + size[0], :3] = np.asarray(images[index])
+                        name = (
+                            task.custom_names.iat[i, j]
+                            if task.custom_names is not None and not pd.isna(task.custom_names.iat[i, j])
+                            else filenames[index]
+                        )
+                        labels.append((str(name), (x, y)))
+
+            # A mapped image is read-only, so each label is rendered into a small mask
+            # and blended (black text) straight into the buffer
+            for name, (x, y) in labels:
+                right, bottom = font.getbbox(name)[2:]
+                width, height = min(right, grid_width - x), min(bottom, grid_height - y)
+                if width <= 0 or height <= 0:
+                    continue
+                label_mask = Image.new('L', (right, bottom), 0)
+                self.draw_text(ImageDraw.Draw(label_mask), name, (0, 0), font)
+                alpha = np.asarray(label_mask, dtype=np.uint16)[:height, :width, None]
+                region = buf[y:y + height, x:x + width, :3]
+                region[...] = region * (255 - alpha) // 255
+
+            _report(task, advance=20, description="Saving grid...")
+
+            # Create output directory if it doesn't exist
+            output_path = Path(task.output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+
+            grid_image = Image.frombuffer('RGBX', (grid_width, grid_height), buf, 'raw', 'RGBX', 0, 1)
+            input_name = Path(task.input_dir).name
+            output_format = task.output_format
+            if output_format != 'png' and max(grid_width, grid_height) > JPEG_MAX_DIMENSION:
+                self.logger.warning(f"Grid {grid_width}x{grid_height} exceeds the JPEG size limit "
+                                    f"({JPEG_MAX_DIMENSION} px); saving as PNG instead")
+                output_format = 'png'
+            if output_format == 'png':
+                output_file = output_path / f"{input_name}_grid.png"
+                # PNG has no RGBX mode, so this path pays for one RGB copy
+                # Save with optimal settings for speed and quality
+                grid_image.convert('RGB').save(output_file,
+                                               format='PNG',
+                                               optimize=False,  # Disable optimization for faster saving
+                                               compress_level=1)  # Use minimal compression for faster saving
+            else:
+                # JPEG encodes large overview grids several times faster than PNG,
+                # and reads RGBX rows straight from the mapping
+                output_file = output_path / f"{input_name}_grid.jpg"
+                grid_image.save(output_file,
+                                format='JPEG',
+                                quality=85,
+                                subsampling=2,  # 4:2:0
+                                progressive=False)
+            return output_file
+        finally:
+            del region, grid_image, buf
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size: int) -> ImageFont.FreeTypeFont:
+    # Font sizes repeat across a batch, so each one is looked up on disk only once
+    try:
+        return ImageFont.truetype('arial.ttf', size)
+    except IOError:
+        try:
+            # Try system font as fallback
+            return ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', size)
+        except IOError:
+            return ImageFont.load_default()
+
+
+def _init_worker(progress_queue) -> None:
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _report(task: ImageProcessingTask, **update) -> None:
+    if _progress_queue is not None:
+        _progress_queue.put((task.index, update))
+
+
+def create_image_grid(task: ImageProcessingTask) -> None:
+    # Module-level entry point so the task can be pickled into a worker process
+    ImageProcessor().create_image_grid(task)
+
+
+def _drain_progress(progress_queue, progress: Progress, task_ids: Dict[int, int],
+                    tasks: Dict[int, ImageProcessingTask]) -> None:
+    while True:
+        try:
+            index, update = progress_queue.get_nowait()
+        except queue.Empty:
+            return
+        if index not in task_ids:
+            task_ids[index] = progress.add_task(
+                f"Processing {os.path.basename(tasks[index].input_dir)}",
+                total=100
+            )
+        progress.update(task_ids[index], **update)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_layout(path, mtime):
+    return pd.read_excel(path, header=None)
+
+
+def read_layout(path):
+    # Keyed on mtime so an edited layout file is re-read
+    return _read_layout(path, os.path.getmtime(path))
+
+
+def _column(df: pd.DataFrame, name: str, default) -> list:
+    return df[name].tolist() if name in df.columns else [default] * len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create a grid of images from an Excel file')
+    parser.add_argument('user_provided_path', type=str, nargs='?', default=None,
+                        help='Positional form of --path, as accepted by the v5/v7/v8 scripts')
+    parser.add_argument('--path', type=str, default='.',
+                        help='The path where the "BE.xlsx" file is located (default: current directory)')
+    parser.add_argument('--format', choices=['jpeg', 'png'], default='jpeg',
+                        help='Output format for the grid images (default: jpeg)')
+    parser.add_argument('--progress', choices=['rich', 'none'], default='rich',
+                        help='Progress display: rich live bars or none (log lines only) (default: rich)')
+    args = parser.parse_args()
+
+    base_path = Path(args.user_provided_path or args.path)
+    excel_file = base_path / "BE.xlsx"
+
+    if not excel_file.exists():
+        logging.error(f"Excel file not found: {excel_file}")
+        return
+
+    df = pd.read_excel(excel_file)
+    if df.empty:
+        logging.warning(f"No rows found in {excel_file}")
+        return
+
+    # Parse every "COLSxROWS" grid size in one go so a bad row stops the run before any work is dispatched
+    try:
+        grid = df['grid_size'].astype(str).str.split('x', expand=True)
+        if grid.shape[1] != 2:
+            raise ValueError("expected values like '4x3'")
+        grid = grid.astype(int)
+        if (grid <= 0).any(axis=None):
+            raise ValueError("columns and rows must be positive")
+    except (KeyError, ValueError) as e:
+        logging.error(f"Invalid grid_size in {excel_file}: {e}")
+        return
+    df['cols'], df['rows'] = grid[0], grid[1]
+
+    # Set up rich progress display
+    with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            disable=args.progress == 'none',
+    ) as progress:
+        overall_progress = progress.add_task("[cyan]Overall progress", total=len(df))
+        progress_queue = multiprocessing.Queue()
+        task_ids = {}
+        tasks = {}
+
+        # Grid building is CPU-bound, so each task runs in its own process (one per core)
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(progress_queue,)) as executor:
+            futures = []
+
+            # Pull each column out once instead of building a Series per row
+            input_dirs = _column(df, 'input_dir', str(base_path))
+            output_dirs = _column(df, 'output_dir', str(base_path / 'output'))
+            grid_sizes = list(zip(df['cols'].tolist(), df['rows'].tolist()))
+            font_size_factors = _column(df, 'font_size_factor', 0.15)
+            layout_files = df['layout_file'].tolist()
+
+            for index in range(len(df)):
+                input_dir = input_dirs[index]
+                output_dir = output_dirs[index]
+                grid_size = grid_sizes[index]
+                font_size_factor = font_size_factors[index]
+                layout_file = layout_files[index]
+
+                try:
+                    # Layouts are read here so workers receive a plain DataFrame
+                    custom_names = read_layout(layout_file)
+                    if custom_names.shape != (grid_size[1], grid_size[0]):
+                        logging.warning(
+                            f"Layout dimensions mismatch for {input_dir}: "
+                            f"Expected {grid_size[0]}x{grid_size[1]}, got {custom_names.shape[1]}x{custom_names.shape[0]}"
+                        )
+                except Exception as e:
+                    logging.error(f"Failed to read layout file {layout_file}: {e}")
+                    continue
+
+                task = ImageProcessingTask(
+                    input_dir=input_dir,
+                    output_dir=output_dir,
+                    grid_size=grid_size,
+                    font_size_factor=font_size_factor,
+                    custom_names=custom_names,
+                    index=index,
+                    total=len(df),
+                    output_format=args.format
+                )
+                tasks[index] = task
+
+                future = executor.submit(create_image_grid, task)
+                futures.append(future)
+
+            # Wait for all tasks to complete, relaying worker progress as it arrives
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                _drain_progress(progress_queue, progress, task_ids, tasks)
+                for future in done:
+                    try:
+                        future.result()
+                        progress.update(overall_progress, advance=1)
+                    except Exception as e:
+                        logging.error(f"Task failed: {e}")
+
+        # Workers have exited, so anything they queued has been flushed
+        _drain_progress(progress_queue, progress, task_ids, tasks)
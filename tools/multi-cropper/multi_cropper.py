@@ -1,10 +1,14 @@
 import os
-import glob
+import contextlib
 from PIL import Image
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.widgets import RectangleSelector
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'})
+JPEG_SAVE_OPTIONS = {'quality': 95, 'optimize': False}
 
 class ImageCropper:
     def __init__(self, image_folder, output_folder=None):
@@ -14,16 +18,19 @@ class ImageCropper:
         self.selector = None
         self.ax = None
         self.fig = None
+        self._first_path = None  # The image shown for selection stays decoded for the crop pass
+        self._first_image = None
         
         # Create output folder if it doesn't exist
         os.makedirs(self.output_folder, exist_ok=True)
         
-        # Get all image files
-        self.image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.tiff', '*.gif']
-        self.image_files = []
-        for ext in self.image_extensions:
-            self.image_files.extend(glob.glob(os.path.join(image_folder, ext)))
-            self.image_files.extend(glob.glob(os.path.join(image_folder, ext.upper())))
+        # Get all image files in one directory pass (case-insensitive extension match)
+        self.image_extensions = IMAGE_EXTENSIONS
+        with os.scandir(image_folder) as entries:
+            self.image_files = sorted(
+                e.path for e in entries
+                if e.is_file() and os.path.splitext(e.name)[1].lower() in self.image_extensions
+            )
         
         if not self.image_files:
             raise ValueError(f"No image files found in {image_folder}")
@@ -51,6 +58,7 @@ class ImageCropper:
         # Load the first image
         first_image_path = self.image_files[0]
         image = Image.open(first_image_path)
+        self._first_path, self._first_image = first_image_path, image
         
         print(f"Select crop area on: {os.path.basename(first_image_path)}")
         print("Instructions:")
@@ -82,46 +90,65 @@ class ImageCropper:
         
         return self.crop_coords
     
+    def _open_image(self, image_path):
+        if image_path == self._first_path and self._first_image is not None:
+            return contextlib.nullcontext(self._first_image)
+        return Image.open(image_path)
+    
+    def _crop_one(self, image_path):
+        """Crop and save a single image. Returns (success, message)."""
+        left, top, right, bottom = self.crop_coords
+        filename = os.path.basename(image_path)
+        try:
+            # Open image (the first one is already decoded from the selection step)
+            with self._open_image(image_path) as image:
+                # Check if crop coordinates are within image bounds
+                img_width, img_height = image.size
+                if not (left >= 0 and top >= 0 and
+                        right <= img_width and bottom <= img_height and
+                        left < right and top < bottom):
+                    return False, f"✗ Skipped {filename}: crop area outside image bounds"
+                
+                # Crop the image
+                cropped_image = image.crop((left, top, right, bottom))
+            
+            # Generate output filename
+            name, ext = os.path.splitext(filename)
+            output_path = os.path.join(self.output_folder, f"{name}_cropped{ext}")
+            
+            # Save cropped image; quality only applies to JPEG, and a single Huffman pass is enough
+            cropped_image.save(output_path, **(JPEG_SAVE_OPTIONS if ext.lower() in ('.jpg', '.jpeg') else {}))
+            return True, filename
+        
+        except Exception as e:
+            return False, f"✗ Error processing {filename}: {str(e)}"
+    
     def crop_all_images(self):
         """Apply the selected crop to all images"""
         if self.crop_coords is None:
             raise ValueError("No crop coordinates available. Run select_crop_area() first.")
         
         left, top, right, bottom = self.crop_coords
-        successful_crops = 0
         
         print(f"\nApplying crop ({left}, {top}, {right}, {bottom}) to all images...")
         
-        for i, image_path in enumerate(self.image_files):
-            try:
-                # Open image
-                image = Image.open(image_path)
-                
-                # Check if crop coordinates are within image bounds
-                img_width, img_height = image.size
-                if (left >= 0 and top >= 0 and 
-                    right <= img_width and bottom <= img_height and
-                    left < right and top < bottom):
-                    
-                    # Crop the image
-                    cropped_image = image.crop((left, top, right, bottom))
-                    
-                    # Generate output filename
-                    filename = os.path.basename(image_path)
-                    name, ext = os.path.splitext(filename)
-                    output_path = os.path.join(self.output_folder, f"{name}_cropped{ext}")
-                    
-                    # Save cropped image
-                    cropped_image.save(output_path, quality=95)
-                    successful_crops += 1
-                    
-                    print(f"✓ Processed ({i+1}/{len(self.image_files)}): {filename}")
-                    
-                else:
-                    print(f"✗ Skipped {os.path.basename(image_path)}: crop area outside image bounds")
-                    
-            except Exception as e:
-                print(f"✗ Error processing {os.path.basename(image_path)}: {str(e)}")
+        # PIL releases the GIL while decoding and encoding, so images are cropped on a thread pool
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+            results = list(executor.map(self._crop_one, self.image_files))
+        
+        # Release the cached first image
+        if self._first_image is not None:
+            self._first_image.close()
+            self._first_image = None
+        
+        # Report in file order once every image is done
+        successful_crops = 0
+        for i, (success, message) in enumerate(results):
+            if success:
+                successful_crops += 1
+                print(f"✓ Processed ({i+1}/{len(self.image_files)}): {message}")
+            else:
+                print(message)
         
         print(f"\nCompleted! Successfully cropped {successful_crops}/{len(self.image_files)} images")
         print(f"Cropped images saved to: {self.output_folder}")
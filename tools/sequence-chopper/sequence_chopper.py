@@ -2,30 +2,20 @@ f = "TAAtccctatcagtgatagagaGAGAGTGTTAGAACTGGtccctatcagtgatagagaACGTGCGGTTTCTCTGC
 r = "ccggcgctggctggggtccttgggcttgctcttgctgctccccatggtggcGGTACCaccggtgcgatctgacggttcactaaacgagctctgcttatataggcctcccaccgtacacgcctagccgttctctatcactgatagggaAAGCAAAAGTGATATGTtctctatcactgatagggaGCGACACTGCATCTAGGtctctatcactgaz"+"tagggaCAGCGCAACAACGCAACtctctatcactgatagggaAGCTCGAGGTGTTCTTCtctctatcactgatagggaGCAGAGAAACCGCACGTtctctatcactgatagggaCCAGTTCTAACACTCTCtctctatcactgatagggaTTAAT"
 
 def ChopSeq(a, b, c):
-    primerlistf = []  # Initialize the list to store forward sequences
-    primerlistr = []  # Initialize the list to store reverse sequences
     n = c  # Define the chunk size
 
-    # Handle forward primers
-    for i in range(0, len(a), n):
-        temp = a[i:i+n]
-        primerlistf.append(temp)
+    # Slice both sequences into chunks of n
+    primerlistf = [a[i:i+n] for i in range(0, len(a), n)]
+    primerlistr = [b[i:i+n] for i in range(0, len(b), n)]
 
-    # Handle reverse primers
-    for i in range(0, len(b), n):
-        temp = b[i:i+n]
-        primerlistr.append(temp)
-    primerlistr = list(reversed(primerlistr))  # Reverse the list after it's fully populated
+    # Forward primers labelled 'F', then reverse primers labelled 'R' from the last chunk back
+    lines = [f'{index}F\t{primer}\n' for index, primer in enumerate(primerlistf, 1)]
+    lines += [f'{index}R\t{primer}\n' for index, primer in enumerate(reversed(primerlistr), 1)]
 
     # Write both forward and reverse primers to the same file
     filename = 'Primers_output.txt'
     with open(filename, 'w') as file:
-        # Write forward primers with label 'F'
-        for index, primer in enumerate(primerlistf, 1):
-            file.write(f'{index}F\t{primer}\n')
-        # Write reverse primers with label 'R'
-        for index, primer in enumerate(primerlistr, 1):
-            file.write(f'{index}R\t{primer}\n')
+        file.writelines(lines)
 
     print(f"File '{filename}' has been written successfully.")
 
@@ -1,72 +1,97 @@
-import pandas as pd
+import argparse
+import openpyxl
 import os
-import sys
+
+OUTPUT_SHEET = 'Modified Sequences'
+
+
+# Complement table for str.translate; bases outside ACGT pass through unchanged
+_RC_TABLE = str.maketrans("ACGTacgt", "TGCAtgca")
 
 
 def reverse_complement(dna_seq):
-    complement = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
-    return ''.join(complement.get(base, base) for base in reversed(dna_seq))
+    return dna_seq.translate(_RC_TABLE)[::-1]
 
 
 def endswith_ngg(dna_seq):
     return dna_seq[-3] in 'ATCG' and dna_seq[-2:] == 'GG'
 
 
-def process_dna_sequences(file_path):
+def process_dna_sequences(file_path, strip_ngg='ask'):
     # Check if the file exists
     if not os.path.exists(file_path):
         print(f"The file {file_path} does not exist.")
         return
 
-    # Read the Excel file without headers and only the first two columns
-    df = pd.read_excel(file_path, header=None, usecols=[0, 1])
-
-    # Set column names
-    df.columns = ['name', 'DNA sequence']
-
-    # Debug: Print the DataFrame
-    print("Input DataFrame:")
-    print(df)
-
-    # Prepare the data for the new Excel file
-    data = []
-    for index, row in df.iterrows():
-        name = row['name']
-        dna_seq = str(row['DNA sequence'])
-
-        if pd.isnull(name) or pd.isnull(dna_seq):
+    # Read the first sheet without headers and only the first two columns (name, DNA sequence);
+    # data_only returns the cached result of formula cells rather than the formula text
+    wb_in = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = list(wb_in.worksheets[0].iter_rows(max_col=2, values_only=True))
+    finally:
+        wb_in.close()
+
+    # Debug: Print the input rows
+    print("Input rows:")
+    for index, row in enumerate(rows, 1):
+        print(index, *row)
+
+    # Collect the usable rows first so NGG handling can be decided once for the whole sheet
+    entries = []
+    for index, (name, dna_seq) in enumerate(rows):
+        if name is None and dna_seq is None:
+            continue  # Blank (e.g. formatted but empty) row
+        if name is None or dna_seq is None:
             print(f"Skipping row {index + 1} due to missing data.")
             continue
+        entries.append((name, str(dna_seq)))
+
+    # Identify NGG at the end and ask the user once whether to remove it
+    ngg_names = [name for name, dna_seq in entries if endswith_ngg(dna_seq)]
+    remove_ngg = strip_ngg == 'yes'
+    if ngg_names and strip_ngg == 'ask':
+        print(f"NGG detected at the end of {len(ngg_names)} sequence(s): {', '.join(map(str, ngg_names))}")
+        remove_ngg = input("Do you want to remove NGG from these sequences? (y/n): ").strip().lower() == 'y'
+
+    # Build the output column-wise rather than row by row
+    names = [name for name, _ in entries]
+    dna_seqs = [dna_seq[:-3] if remove_ngg and endswith_ngg(dna_seq) else dna_seq for _, dna_seq in entries]
+    rev_comp_seqs = [reverse_complement(dna_seq) for dna_seq in dna_seqs]
+
+    # Format the sequences; F and R oligos alternate in the output
+    data = [
+        row
+        for name, dna_seq, rev_comp_seq in zip(names, dna_seqs, rev_comp_seqs)
+        for row in ([f'{name}-oligo-F', 'CACCG' + dna_seq.lower()],
+                    [f'{name}-oligo-R', 'AAAC' + rev_comp_seq.lower() + 'C'])
+    ]
+
+    # Write the results to a new sheet in the same Excel file, replacing it in place if it exists;
+    # a normal load keeps the other sheets' formulas intact when the file is saved
+    wb = openpyxl.load_workbook(file_path)
+    sheet_index = None
+    if OUTPUT_SHEET in wb.sheetnames:
+        sheet_index = wb.sheetnames.index(OUTPUT_SHEET)
+        del wb[OUTPUT_SHEET]
+    ws_out = wb.create_sheet(OUTPUT_SHEET, sheet_index)
+    ws_out.append(['Name', 'Sequence'])
+    for row in data:
+        ws_out.append(row)
+    wb.save(file_path)
 
-        # Identify NGG at the end and ask user to remove
-        if endswith_ngg(dna_seq):
-            user_input = input(f"NGG detected at the end of {name}. Do you want to remove NGG? (y/n): ").strip().lower()
-            if user_input == 'y':
-                dna_seq = dna_seq[:-3]
-
-        rev_comp_seq = reverse_complement(dna_seq)
-
-        # Format the sequences
-        formatted_dna_seq = 'CACCG' + dna_seq.lower()
-        formatted_rev_comp_seq = 'AAAC' + rev_comp_seq.lower() + 'C'
-
-        data.append([f'{name}-oligo-F', formatted_dna_seq])
-        data.append([f'{name}-oligo-R', formatted_rev_comp_seq])
+    # Open the Excel file
+    os.system(f'start excel.exe "{file_path}"')
 
-    # Convert the list to a DataFrame
-    output_df = pd.DataFrame(data, columns=['Name', 'Sequence'])
 
-    # Write the DataFrame back to the same Excel file but in a new sheet
-    with pd.ExcelWriter(file_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
-        output_df.to_excel(writer, index=False, sheet_name='Modified Sequences')
+def main():
+    parser = argparse.ArgumentParser(description='Generate sgRNA oligo sequences from an Excel list of names and DNA sequences')
+    parser.add_argument('file_path', help='Excel file with names in column A and DNA sequences in column B')
+    parser.add_argument('--strip-ngg', choices=['yes', 'no', 'ask'], default='ask',
+                        help='Remove a trailing NGG (PAM) from sequences: yes, no, or ask once (default: ask)')
+    args = parser.parse_args()
 
-    # Open the Excel file
-    os.system(f'start excel.exe "{file_path}"')
+    process_dna_sequences(args.file_path, strip_ngg=args.strip_ngg)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python script.py path_to_your_excel_file.xlsx")
-    else:
-        file_path = sys.argv[1]
-        process_dna_sequences(file_path)
+    main()
@@ -8,8 +8,62 @@ import time
 import multiprocessing as mp
 from concurrent.futures import ThreadPoolExecutor
 
+# numba is optional; without it the NumPy implementation in extract_reference_features is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Side length of the square patch sampled around each reference point
+PATCH_SIZE = 8
+
+# Features are 0-255 intensities; differences are reported on a 0-1 scale
+INV_SCALE = 1.0 / 255.0
+
+# Coarse pre-check: frames are compared as tiny grayscale thumbnails first, and the
+# multipoint features only run when that difference reaches this fraction of the threshold
+PREFILTER_SIZE = (160, 90)
+PREFILTER_RATIO = 0.5
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _patch_features(gray, ys, xs, patch_size):
+        """Compiled equivalent of the NumPy patch statistics: mean, std, grad_x, grad_y per point."""
+        half = patch_size // 2
+        n = patch_size * patch_size
+        features = np.empty(ys.shape[0] * 4)
+        for p in range(ys.shape[0]):
+            y0 = ys[p] - half
+            x0 = xs[p] - half
+            total = 0.0
+            for i in range(patch_size):
+                for j in range(patch_size):
+                    total += gray[y0 + i, x0 + j]
+            mean = total / n
+            sq_dev = 0.0
+            grad_x = 0.0
+            grad_y = 0.0
+            for i in range(patch_size):
+                for j in range(patch_size):
+                    v = np.int32(gray[y0 + i, x0 + j])
+                    sq_dev += (v - mean) ** 2
+                    # & 0xFF reproduces np.diff's wrap-around on uint8 pixels
+                    if j + 1 < patch_size:
+                        grad_x += (np.int32(gray[y0 + i, x0 + j + 1]) - v) & 0xFF
+                    if i + 1 < patch_size:
+                        grad_y += (np.int32(gray[y0 + i + 1, x0 + j]) - v) & 0xFF
+            features[4 * p] = mean
+            features[4 * p + 1] = np.sqrt(sq_dev / n)
+            features[4 * p + 2] = grad_x / (patch_size * (patch_size - 1))
+            features[4 * p + 3] = grad_y / (patch_size * (patch_size - 1))
+        return features
+else:
+    _patch_features = None
+
 class SlideExtractor:
-    def __init__(self, video_path, output_dir="./screenshots", threshold=0.02, num_workers=None, reference_points=100):
+    def __init__(self, video_path, output_dir="./screenshots", threshold=0.02, num_workers=None, reference_points=100,
+                 downscale=0.25, sample_fps=2.0, save_png=True):
         """
         Initialize the slide extractor.
         
@@ -17,27 +71,39 @@ class SlideExtractor:
             video_path (str): Path to the input video file
             output_dir (str): Directory to save screenshots
             threshold (float): Threshold for detecting slide changes (0.0-1.0)
-            num_workers (int): Number of worker threads (None = auto-detect)
+            num_workers (int): Number of threads used to save screenshots (None = auto-detect)
             reference_points (int): Number of reference points to sample across frame
+            downscale (float): Scale factor applied to frames before feature extraction (1.0 = full size)
+            sample_fps (float): Frames per second of video checked for slide changes (0 = every frame)
+            save_png (bool): Write each slide to output_dir as a PNG (False = PDF only)
         """
         self.video_path = video_path
         self.output_dir = Path(output_dir)
         self.threshold = threshold
         self.num_workers = num_workers or min(mp.cpu_count(), 16)
         self.reference_points = reference_points
+        self.downscale = downscale
+        self.sample_fps = sample_fps
+        self.save_png = save_png
         self.screenshots = []
+        self.slides = []  # RGB images of the detected slides, kept only when no PNGs are written
         self.sample_points = None  # Will be calculated based on frame size
+        self._ys = None  # Point centres as int32 arrays, cached with the points
+        self._xs = None
+        self._patch_ys = None  # Row/column indices of every patch pixel, cached with the points
+        self._patch_xs = None
         
         # Create output directory if it doesn't exist
-        self.output_dir.mkdir(exist_ok=True)
+        if self.save_png:
+            self.output_dir.mkdir(exist_ok=True)
         
     def generate_sample_points(self, frame_height, frame_width):
         """Generate strategically distributed sample points to avoid slide grid alignment."""
         if self.sample_points is not None:
             return self.sample_points
         
-        # Use fixed random seed for consistent sampling across frames
-        np.random.seed(42)
+        # Local generator with a fixed seed for consistent sampling; the global NumPy RNG is left alone
+        rng = np.random.default_rng(42)
         
         # Create margins to avoid UI elements and slide borders
         margin_h = int(frame_height * 0.08)
@@ -46,46 +112,49 @@ class SlideExtractor:
         usable_height = frame_height - 2 * margin_h
         usable_width = frame_width - 2 * margin_w
         
-        points = []
-        
         # Strategy: Combine random sampling with diagonal bias to avoid slide structure
-        for i in range(self.reference_points):
-            if i < self.reference_points // 2:
-                # First half: Pure random distribution
-                y = margin_h + np.random.randint(0, usable_height)
-                x = margin_w + np.random.randint(0, usable_width)
-            else:
-                # Second half: Diagonal and offset patterns to break slide alignment
-                # Use diagonal bias with random offset
-                diagonal_progress = (i - self.reference_points // 2) / (self.reference_points // 2)
-                
-                # Create diagonal sweep with random perpendicular offset
-                base_y = margin_h + int(diagonal_progress * usable_height)
-                base_x = margin_w + int(diagonal_progress * usable_width)
-                
-                # Add random offset perpendicular to diagonal
-                offset_range = min(usable_height, usable_width) // 8
-                y_offset = np.random.randint(-offset_range, offset_range)
-                x_offset = np.random.randint(-offset_range, offset_range)
-                
-                y = np.clip(base_y + y_offset, margin_h, frame_height - margin_h)
-                x = np.clip(base_x + x_offset, margin_w, frame_width - margin_w)
-            
-            points.append((int(y), int(x)))
-        
-        # Remove duplicates and ensure good distribution
-        unique_points = list(set(points))
-        
-        # If we lost too many to duplicates, fill with more random points
-        while len(unique_points) < self.reference_points:
-            y = margin_h + np.random.randint(0, usable_height)
-            x = margin_w + np.random.randint(0, usable_width)
-            point = (int(y), int(x))
-            if point not in unique_points:
-                unique_points.append(point)
-        
-        # Keep only the requested number of points
-        self.sample_points = unique_points[:self.reference_points]
+        n_random = self.reference_points // 2
+        n_diagonal = self.reference_points - n_random
+        
+        # First half: Pure random distribution
+        random_y = margin_h + rng.integers(0, usable_height, size=n_random)
+        random_x = margin_w + rng.integers(0, usable_width, size=n_random)
+        
+        # Second half: Diagonal sweep with random perpendicular offset to break slide alignment
+        diagonal_progress = np.arange(n_diagonal) / max(n_random, 1)
+        base_y = margin_h + (diagonal_progress * usable_height).astype(np.int64)
+        base_x = margin_w + (diagonal_progress * usable_width).astype(np.int64)
+        offset_range = min(usable_height, usable_width) // 8
+        offsets = (rng.integers(-offset_range, offset_range, size=(n_diagonal, 2))
+                   if offset_range > 0 else np.zeros((n_diagonal, 2), dtype=np.int64))
+        diagonal_y = np.clip(base_y + offsets[:, 0], margin_h, frame_height - margin_h)
+        diagonal_x = np.clip(base_x + offsets[:, 1], margin_w, frame_width - margin_w)
+        
+        points = np.column_stack((np.concatenate((random_y, diagonal_y)), np.concatenate((random_x, diagonal_x))))
+        
+        # Remove duplicates; if we lost too many, top up with more random points
+        points = np.unique(points, axis=0)
+        while len(points) < self.reference_points:
+            missing = self.reference_points - len(points)
+            extra = np.column_stack((margin_h + rng.integers(0, usable_height, size=missing),
+                                     margin_w + rng.integers(0, usable_width, size=missing)))
+            points = np.unique(np.concatenate((points, extra)), axis=0)
+        
+        # Keep only the requested number of points as an (N, 2) int32 array of (y, x),
+        # clamped so every 8x8 patch lies inside the frame
+        half_patch = PATCH_SIZE // 2
+        points = points[:self.reference_points]
+        points[:, 0] = np.clip(points[:, 0], half_patch, frame_height - half_patch)
+        points[:, 1] = np.clip(points[:, 1], half_patch, frame_width - half_patch)
+        self.sample_points = points.astype(np.int32)
+        
+        # Index arrays for gathering all patches at once: rows (P, 8, 1), columns (P, 1, 8)
+        offsets = np.arange(-half_patch, half_patch, dtype=np.int32)
+        ys = np.ascontiguousarray(self.sample_points[:, 0])
+        xs = np.ascontiguousarray(self.sample_points[:, 1])
+        self._ys, self._xs = ys, xs
+        self._patch_ys = ys[:, None, None] + offsets[None, :, None]
+        self._patch_xs = xs[:, None, None] + offsets[None, None, :]
         
         print(f"Generated {len(self.sample_points)} strategically distributed sample points")
         print(f"Sampling strategy: 50% random + 50% diagonal-offset to avoid slide alignment")
@@ -93,103 +162,73 @@ class SlideExtractor:
     
     def extract_reference_features(self, frame):
         """Extract features from reference points across the frame."""
-        h, w = frame.shape[:2]
-        points = self.generate_sample_points(h, w)
+        if self._patch_ys is None:
+            self.generate_sample_points(*frame.shape[:2])
         
         # Convert to grayscale
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
         
-        features = []
-        patch_size = 8  # 8x8 patch around each point
-        half_patch = patch_size // 2
+        if _patch_features is not None:
+            return _patch_features(gray, self._ys, self._xs, PATCH_SIZE)
         
-        for y, x in points:
-            # Extract small patch around each point
-            y1, y2 = max(0, y - half_patch), min(h, y + half_patch)
-            x1, x2 = max(0, x - half_patch), min(w, x + half_patch)
-            
-            patch = gray[y1:y2, x1:x2]
-            
-            if patch.size > 0:
-                # Calculate multiple features for each patch
-                mean_intensity = np.mean(patch)
-                std_intensity = np.std(patch)
-                
-                # Simple gradient features
-                if patch.shape[0] > 1 and patch.shape[1] > 1:
-                    grad_x = np.mean(np.abs(np.diff(patch, axis=1)))
-                    grad_y = np.mean(np.abs(np.diff(patch, axis=0)))
-                else:
-                    grad_x = grad_y = 0
-                
-                features.extend([mean_intensity, std_intensity, grad_x, grad_y])
-            else:
-                features.extend([0, 0, 0, 0])  # Default values for edge cases
+        # Gather the 8x8 patch around every point into one (P, 8, 8) array
+        patches = gray[self._patch_ys, self._patch_xs]
         
-        return np.array(features)
+        # Mean, spread and simple gradients of each patch, one reduction per feature
+        mean_intensity = patches.mean(axis=(1, 2))
+        std_intensity = patches.std(axis=(1, 2))
+        grad_x = np.abs(np.diff(patches, axis=2)).mean(axis=(1, 2))
+        grad_y = np.abs(np.diff(patches, axis=1)).mean(axis=(1, 2))
+        
+        # Interleaved per point: mean, std, grad_x, grad_y
+        return np.column_stack((mean_intensity, std_intensity, grad_x, grad_y)).ravel()
     
     def calculate_frame_difference_multipoint(self, features1, features2):
         """Calculate frame difference using multiple reference point features."""
         if len(features1) != len(features2):
             return 1.0  # Maximum difference if feature lengths don't match
         
-        # Normalize features to 0-1 range for consistent comparison
-        features1_norm = features1 / 255.0
-        features2_norm = features2 / 255.0
-        
-        # Calculate mean absolute difference
-        mad = np.mean(np.abs(features1_norm - features2_norm))
-        
-        # Calculate normalized euclidean distance
-        euclidean_dist = np.linalg.norm(features1_norm - features2_norm) / np.sqrt(len(features1))
+        # One difference buffer feeds both metrics; the 0-255 -> 0-1 normalisation
+        # is linear, so it is applied once to the combined result
+        diff = features1 - features2
+        mad = np.abs(diff).mean()
+        euclidean_dist = np.sqrt(np.dot(diff, diff) / len(diff))
         
         # Combine both metrics
-        combined_diff = 0.6 * mad + 0.4 * euclidean_dist
-        
-        return combined_diff
+        return (0.6 * mad + 0.4 * euclidean_dist) * INV_SCALE
     
-    def process_frame_batch(self, frame_batch_info):
-        """Process a batch of frames and return detection results."""
-        frames, start_frame_num = frame_batch_info
-        detections = []
-        
-        if len(frames) < 2:
-            return detections
-        
-        # Extract reference point features for all frames in batch
-        features_list = []
-        for frame in frames:
-            features = self.extract_reference_features(frame)
-            features_list.append(features)
-        
-        # Calculate differences for consecutive frames
-        for i in range(1, len(features_list)):
-            diff = self.calculate_frame_difference_multipoint(features_list[i-1], features_list[i])
-            
-            if diff > self.threshold:
-                frame_num = start_frame_num + i
-                detections.append((frame_num, diff, frames[i]))
-        
-        return detections
-    
-    def save_screenshot(self, frame, frame_number):
-        """Save a frame as a screenshot."""
+    def _next_screenshot_path(self, frame_number):
+        """Reserve the next slide filename; called in detection order so numbering stays sequential."""
         filename = f"slide_{len(self.screenshots):04d}_frame_{frame_number}.png"
         filepath = self.output_dir / filename
-        
-        # Convert BGR to RGB for saving
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        image = Image.fromarray(frame_rgb)
-        image.save(filepath, "PNG")
-        
         self.screenshots.append(filepath)
-        print(f"Saved screenshot: {filename}")
+        return filepath
+    
+    def _write_screenshot(self, frame, filepath):
+        # OpenCV writes the BGR frame directly; screenshots are transient, so a lighter
+        # compression level than the default 6 is used
+        if not cv2.imwrite(str(filepath), frame, [cv2.IMWRITE_PNG_COMPRESSION, 3]):
+            raise IOError(f"Could not write screenshot: {filepath}")
         
+        print(f"Saved screenshot: {filepath.name}")
+    
+    @staticmethod
+    def _read_sample(cap, skip):
+        """Grab past `skip` frames, then decode the next one. Returns (frames skipped, frame or None)."""
+        skipped = 0
+        while skipped < skip:
+            if not cap.grab():
+                return skipped, None
+            skipped += 1
+        ret, frame = cap.read()
+        return skipped, frame if ret else None
+    
     def process_video(self):
-        """Process the video using fast batch processing with multi-point detection."""
+        """Process the video as a stream of frames with multi-point detection."""
         print(f"Processing video: {self.video_path}")
-        print(f"Settings: threshold={self.threshold}, reference_points={self.reference_points}")
-        print(f"Using {self.num_workers} worker threads for parallel processing")
+        print(f"Settings: threshold={self.threshold}, reference_points={self.reference_points}, "
+              f"downscale={self.downscale}, sample_fps={self.sample_fps}")
+        print(f"Using {self.num_workers} worker threads for saving screenshots")
         
         # Open video
         cap = cv2.VideoCapture(str(self.video_path))
@@ -203,104 +242,108 @@ class SlideExtractor:
         
         print(f"Video properties: {total_frames} frames, {fps:.2f} FPS")
         
-        # Load all frames in batches
-        batch_size = 50  # Smaller batches for better memory management
-        frame_batches = []
-        all_frames = []
-        
-        print("Loading frames into memory...")
+        print("Scanning frames with multi-point detection...")
         start_time = time.time()
         
-        frame_count = 0
-        current_batch = []
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                if current_batch:
-                    frame_batches.append((current_batch.copy(), frame_count - len(current_batch)))
-                break
-            
-            all_frames.append(frame)
-            current_batch.append(frame)
-            frame_count += 1
-            
-            if len(current_batch) >= batch_size:
-                frame_batches.append((current_batch.copy(), frame_count - len(current_batch)))
-                current_batch = []
-            
-            # Progress indicator
-            if frame_count % (total_frames // 10) == 0:
-                progress = (frame_count / total_frames) * 100
-                print(f"Loading progress: {progress:.1f}%")
-        
-        cap.release()
-        loading_time = time.time() - start_time
-        print(f"Loaded {len(all_frames)} frames in {loading_time:.2f} seconds")
+        # Slides change at human pace, so only every `stride`-th frame is retrieved and compared;
+        # the frames in between are just grabbed to advance the stream. Frame numbers stay exact.
+        stride = max(1, int(fps / self.sample_fps)) if fps > 0 and self.sample_fps > 0 else 1
+        print(f"Checking every {stride} frame(s) (~{self.sample_fps:g} per second)")
         
-        # Save first frame as first slide
-        self.save_screenshot(all_frames[0], 0)
-        slides_detected = 1
-        
-        # Process batches in parallel
-        print(f"Processing {len(frame_batches)} batches with multi-point detection...")
-        start_time = time.time()
-        
-        all_detections = []
-        
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            # Submit all batch jobs
-            futures = [executor.submit(self.process_frame_batch, batch) for batch in frame_batches]
-            
-            # Collect results as they complete
-            for i, future in enumerate(futures):
-                batch_detections = future.result()
-                all_detections.extend(batch_detections)
+        # Each sampled frame is compared with the previous one as soon as it is decoded; only the
+        # previous frame is kept, so memory use does not grow with video length
+        prev_small = prev_tiny = prev_features = None
+        frame_count = 0
+        slides_detected = 0
+        progress_step = max(1, total_frames // 10)
+        next_progress = progress_step
+        
+        try:
+            # Decoding (which releases the GIL) runs one sample ahead in a reader thread while
+            # the current frame is compared; PNG encoding of detected slides runs on worker threads
+            with ThreadPoolExecutor(max_workers=1) as reader, \
+                    ThreadPoolExecutor(max_workers=self.num_workers) as savers:
+                saves = []
+                next_sample = reader.submit(self._read_sample, cap, 0)
+                while True:
+                    skipped, frame = next_sample.result()
+                    frame_count += skipped
+                    if frame is None:
+                        break
+                    frame_number = frame_count
+                    frame_count += 1
+                    next_sample = reader.submit(self._read_sample, cap, stride - 1)
+                    
+                    # Patch statistics don't need native resolution; detection runs on a shrunken
+                    # copy and the full-resolution frame is only used when a slide is saved
+                    if self.downscale < 1.0:
+                        frame_small = cv2.resize(frame, (0, 0), fx=self.downscale, fy=self.downscale,
+                                                 interpolation=cv2.INTER_AREA)
+                    else:
+                        frame_small = frame
+                    tiny = cv2.resize(cv2.cvtColor(frame_small, cv2.COLOR_BGR2GRAY), PREFILTER_SIZE,
+                                      interpolation=cv2.INTER_AREA)
+                    features = None
+                    
+                    # First frame is the first slide
+                    is_slide = prev_small is None
+                    if not is_slide:
+                        # Most pairs are the same static slide; the thumbnail diff rules those out cheaply
+                        coarse = cv2.absdiff(prev_tiny, tiny).mean() * INV_SCALE
+                        if coarse >= self.threshold * PREFILTER_RATIO:
+                            # Features are computed lazily, so the previous frame's may still be missing
+                            if prev_features is None:
+                                prev_features = self.extract_reference_features(prev_small)
+                            features = self.extract_reference_features(frame_small)
+                            difference = self.calculate_frame_difference_multipoint(prev_features, features)
+                            is_slide = difference > self.threshold
+                            if is_slide:
+                                print(f"Slide change detected at frame {frame_number} (difference: {difference:.4f})")
+                    
+                    if is_slide:
+                        slides_detected += 1
+                        if self.save_png:
+                            saves.append(savers.submit(self._write_screenshot, frame,
+                                                       self._next_screenshot_path(frame_number)))
+                        else:
+                            # Nothing is written to disk, so the PDF is built from frames kept in memory
+                            self.slides.append(Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)))
+                    
+                    prev_small, prev_tiny, prev_features = frame_small, tiny, features
+                    
+                    # Progress indicator
+                    if total_frames and frame_count >= next_progress:
+                        progress = (frame_count / total_frames) * 100
+                        print(f"Processing progress: {progress:.1f}%")
+                        next_progress = (frame_count // progress_step + 1) * progress_step
                 
-                progress = ((i + 1) / len(futures)) * 100
-                print(f"Batch processing progress: {progress:.1f}%")
+                # Surface any error from the background saves
+                for future in saves:
+                    future.result()
+        finally:
+            cap.release()
         
-        # Sort detections by frame number
-        all_detections.sort(key=lambda x: x[0])
-        
-        # Save detected slides
-        print("Saving detected slides...")
-        for frame_num, difference, frame in all_detections:
-            self.save_screenshot(frame, frame_num)
-            slides_detected += 1
-            print(f"Slide change detected at frame {frame_num} (difference: {difference:.4f})")
-        
-        processing_time = time.time() - start_time
-        total_time = loading_time + processing_time
+        total_time = time.time() - start_time
         
         print(f"\nProcessing complete!")
         print(f"Total slides detected: {slides_detected}")
-        print(f"Processing time: {processing_time:.2f} seconds")
         print(f"Total time: {total_time:.2f} seconds")
-        print(f"Processing speed: {len(all_frames)/total_time:.1f} FPS")
+        print(f"Processing speed: {frame_count/total_time:.1f} FPS")
         
         if slides_detected < 20:
             print(f"Consider lowering threshold for more detections")
         
-        return self.screenshots
+        return self.screenshots if self.save_png else self.slides
     
     def create_pdf(self, output_pdf="slides.pdf"):
-        """Combine all screenshots into a PDF file in the current directory."""
-        if not self.screenshots:
+        """Combine all detected slides into a PDF file in the current directory."""
+        # Written slides are read back from their PNGs (opened lazily); otherwise they were kept in memory
+        images = [Image.open(path) for path in self.screenshots] if self.save_png else self.slides
+        if not images:
             print("No screenshots to combine into PDF")
             return
         
-        print(f"Creating PDF with {len(self.screenshots)} slides...")
-        
-        # Open all images
-        images = []
-        for screenshot_path in self.screenshots:
-            img = Image.open(screenshot_path)
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            images.append(img)
+        print(f"Creating PDF with {len(images)} slides...")
         
         # Save PDF in current directory (not in screenshots folder)
         pdf_path = Path.cwd() / output_pdf
@@ -314,12 +357,6 @@ class SlideExtractor:
         
         print(f"PDF created in current directory: {pdf_path}")
         return pdf_path
-    
-    def cleanup_screenshots(self):
-        """Remove individual screenshot files after PDF creation."""
-        for screenshot_path in self.screenshots:
-            screenshot_path.unlink()
-        print("Screenshot files deleted.")
 
 
 def find_mp4_in_folder():
@@ -343,9 +380,13 @@ def main():
     parser.add_argument("--pdf-name", default="slides.pdf",
                        help="Name of output PDF file (default: slides.pdf)")
     parser.add_argument("--cleanup", action="store_true",
-                       help="Delete individual screenshot files after PDF creation")
+                       help="Don't keep individual screenshot files; only the PDF is written")
     parser.add_argument("--workers", type=int, default=None,
-                       help="Number of worker threads (default: auto-detect)")
+                       help="Number of threads used to save screenshots (default: auto-detect)")
+    parser.add_argument("--downscale", type=float, default=0.25,
+                       help="Scale frames by this factor before detection; 1.0 keeps full size (default: 0.25)")
+    parser.add_argument("--sample-fps", type=float, default=2.0,
+                       help="Frames per second checked for slide changes; 0 checks every frame (default: 2)")
     
     args = parser.parse_args()
     
@@ -370,19 +411,18 @@ def main():
             output_dir=args.output_dir,
             threshold=args.threshold,
             num_workers=args.workers,
-            reference_points=args.reference_points
+            reference_points=args.reference_points,
+            downscale=args.downscale,
+            sample_fps=args.sample_fps,
+            save_png=not args.cleanup
         )
         
         # Extract slides using fast processing
-        screenshots = extractor.process_video()
+        slides = extractor.process_video()
         
-        if screenshots:
+        if slides:
             # Create PDF in current directory
             extractor.create_pdf(args.pdf_name)
-            
-            # Cleanup if requested
-            if args.cleanup:
-                extractor.cleanup_screenshots()
         else:
             print("No slides were extracted from the video")
             
@@ -1,17 +1,19 @@
 import argparse
 
+# U->T (either case) in a single C-level pass over the bytes
+_U2T = bytes.maketrans(b"Uu", b"Tt")
+
 def ut_mutator(rna_sequence):
     """
     Converts an RNA sequence to a DNA sequence by replacing all occurrences of 'U' with 'T'.
 
     Args:
-        rna_sequence (str): RNA sequence to convert.
+        rna_sequence (str): RNA sequence to convert (ASCII).
 
     Returns:
-        str: DNA sequence with 'U' replaced by 'T'.
+        str: DNA sequence with 'U' replaced by 'T' and 'u' by 't'.
     """
-    dna_sequence = rna_sequence.replace('U', 'T')
-    return dna_sequence
+    return rna_sequence.encode('ascii').translate(_U2T).decode('ascii')
 
 def main():
     parser = argparse.ArgumentParser(description='Converts an RNA sequence to a DNA sequence by replacing all occurrences of "U" with "T"')
@@ -1,37 +1,88 @@
+import hashlib
 import io
+import json
+import os
 import zipfile
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
 import streamlit as st
-from PIL import Image
+from PIL import Image, ImageFile
 from streamlit.elements import image as st_image
 from streamlit.elements.lib import image_utils, layout_utils
 from streamlit_drawable_canvas import st_canvas
 
 
-@dataclass
-class CropBox:
+# Uploads are decoded from and crops encoded into in-memory buffers; larger blocks than
+# Pillow's 64 KB default mean far fewer read/write calls per image
+ImageFile.MAXBLOCK = 16 * 1024 * 1024
+
+# Seconds an item stays in the caches holding full-resolution pixels
+# (decoded preview array, encoded entries, built archive)
+ZIP_CACHE_TTL = 600
+
+
+class CropBox(NamedTuple):
+    # A plain (left, top, right, bottom) tuple, so it can be handed to Pillow and the caches as-is
     left: int
     top: int
     right: int
     bottom: int
 
-    def as_tuple(self) -> Tuple[int, int, int, int]:
-        return (self.left, self.top, self.right, self.bottom)
 
+def file_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2, ttl=ZIP_CACHE_TTL)
+def _decode_array(digest: str, _data: bytes) -> np.ndarray:
+    # Keyed on the content digest only, so a re-upload under another name reuses the array; the
+    # leading underscore keeps Streamlit from hashing the raw bytes again. Only the preview image
+    # is decoded here, so a couple of entries is enough.
+    # cache_resource hands back the same array on every rerun (no pickle copy), so it is made read-only
+    array = np.ascontiguousarray(np.asarray(Image.open(io.BytesIO(_data)).convert("RGB")))
+    array.setflags(write=False)
+    return array
 
-def load_images(files) -> List[Tuple[str, Image.Image]]:
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _decodes(digest: str, _data: bytes) -> bool:
+    # A header-only open accepts truncated files, so each upload is fully decoded once;
+    # the result is cached per content digest and the pixels are discarded
+    try:
+        with Image.open(io.BytesIO(_data)) as image:
+            image.load()
+        return True
+    except Exception:
+        return False
+
+
+def load_images(files) -> List[Tuple[str, bytes, str]]:
+    # Uploads are kept as (name, raw bytes, digest); the pixels are decoded again
+    # where they are needed (preview crop, zip build)
     images = []
     for file in files:
-        try:
-            image = Image.open(file).convert("RGB")
-            images.append((file.name, image))
-        except Exception:
+        data = file.getvalue()
+        digest = file_digest(data)
+        if not _decodes(digest, data):
             st.warning(f"Could not open {file.name}")
+            continue
+        images.append((file.name, data, digest))
     return images
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_preview(digest: str, _data: bytes, max_size: int = 900) -> Tuple[Image.Image, Tuple[int, int]]:
+    # Returns the canvas image and the full-resolution size; JPEGs are decoded
+    # at a reduced scale by libjpeg (draft) since only a thumbnail is shown.
+    # Cached per file digest, so canvas interactions don't redo the resize
+    image = Image.open(io.BytesIO(_data))
+    full_size = image.size
+    image.draft("RGB", (max_size, max_size))
+    return resize_for_canvas(image.convert("RGB"), max_size), full_size
+
+
 def ensure_streamlit_image_to_url() -> None:
     if hasattr(st_image, "image_to_url"):
         return
@@ -45,29 +96,131 @@ def ensure_streamlit_image_to_url() -> None:
     st_image.image_to_url = image_to_url
 
 
-def crop_image(image: Image.Image, crop_box: CropBox) -> Image.Image:
-    return image.crop(crop_box.as_tuple())
+# streamlit-drawable-canvas still calls st_image.image_to_url, which newer Streamlit moved;
+# patched once at import rather than on every rerun
+ensure_streamlit_image_to_url()
 
 
-def build_zip(images: List[Tuple[str, Image.Image]], crop_box: CropBox) -> bytes:
+def crop_image(image: Image.Image, crop_box: CropBox) -> Image.Image:
+    return image.crop(crop_box)
+
+
+def crop_array(array: np.ndarray, crop_box: CropBox) -> np.ndarray:
+    # A slice is a view; nothing is copied until Streamlit encodes it
+    return array[crop_box.top:crop_box.bottom, crop_box.left:crop_box.right]
+
+
+def preview_crop(array: np.ndarray, crop_box: CropBox, max_width: int = 1200) -> Union[np.ndarray, Image.Image]:
+    # Crops wider than the preview column are downscaled before Streamlit encodes them; the image is
+    # built from the crop view, since an RGB array can't be wrapped without copying it
+    crop_width = crop_box.right - crop_box.left
+    crop_height = crop_box.bottom - crop_box.top
+    if crop_width <= max_width:
+        return crop_array(array, crop_box)
+    size = (max_width, max(1, round(crop_height * max_width / crop_width)))
+    return Image.fromarray(crop_array(array, crop_box)).resize(size, Image.BILINEAR)
+
+
+# These formats are already compressed; DEFLATE would spend CPU for next to no size gain
+STORED_FORMATS = {"PNG", "JPEG", "GIF"}
+# BMP/TIFF entries are raw pixels; DEFLATE level 1 gets most of the size win far faster than the default 6
+DEFLATE_LEVEL = 1
+
+
+# BMP output is raw rows written front to back, so it is encoded straight into its zip entry
+# instead of being buffered first (TIFF needs a seekable file, so it is buffered)
+STREAMED_FORMATS = {"BMP"}
+
+# Per-format encoder options, tuned for encode speed over output size (same trade-off as DEFLATE_LEVEL)
+_SAVE_KW = {
+    "JPEG": dict(quality=85, optimize=False, progressive=False, subsampling="4:2:0"),
+    "PNG": dict(compress_level=1),
+}
+
+# Lower-case file extension -> Pillow save format
+_EXT_TO_FMT = {
+    "tif": "TIFF",
+    "tiff": "TIFF",
+    "png": "PNG",
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "bmp": "BMP",
+    "gif": "GIF",
+}
+
+
+def output_name_and_format(filename: str) -> Tuple[str, str]:
+    base, _, ext = filename.rpartition(".")
+    # The output format follows the file extension; anything unrecognised is written as PNG
+    save_format = _EXT_TO_FMT.get(ext.lower())
+    if save_format is None:
+        return f"{base}_cropped.png", "PNG"
+    return f"{base}_cropped.{ext}", save_format
+
+
+def _crop_upload(data: bytes, crop_box: CropBox) -> Image.Image:
+    # Full-resolution decode happens here, on the worker thread
+    with Image.open(io.BytesIO(data)) as image:
+        return crop_image(image, crop_box).convert("RGB")
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=ZIP_CACHE_TTL)
+def _encode_entry(digest: str, crop_box: CropBox, save_format: str, _data: bytes) -> bytes:
+    # Memoised per (image, crop box, format), so entries whose inputs didn't change skip the encode;
+    # these are full-resolution crops, so only a few recent ones are kept
+    image_bytes = io.BytesIO()
+    cropped = _crop_upload(_data, crop_box)
+    cropped.save(image_bytes, format=save_format, **_SAVE_KW.get(save_format, {}))
+    return image_bytes.getvalue()
+
+
+def _build_entry(
+    filename: str, data: bytes, digest: str, crop_box: CropBox
+) -> Tuple[str, str, Union[Image.Image, bytes]]:
+    output_name, save_format = output_name_and_format(filename)
+    # A box covering the whole image (the default with nothing drawn) leaves the upload unchanged,
+    # so its original bytes go into the zip without a decode or re-encode; only the header is read
+    with Image.open(io.BytesIO(data)) as image:
+        if crop_box == (0, 0, *image.size):
+            return output_name, save_format, data
+    if save_format in STREAMED_FORMATS:
+        return output_name, save_format, _crop_upload(data, crop_box)
+    return output_name, save_format, _encode_entry(digest, crop_box, save_format, data)
+
+
+def build_zip(images: List[Tuple[str, bytes, str]], crop_box: CropBox) -> bytes:
+    # The cache and download_button both need bytes, so the archive is built in memory;
+    # spooling it to a temp file saved nothing (read() copies just as getvalue() does)
     buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for filename, image in images:
-            cropped = crop_image(image, crop_box)
-            base, ext = filename.rsplit(".", 1)
-            output_name = f"{base}_cropped.{ext}"
-            image_bytes = io.BytesIO()
-            save_format = image.format if image.format else ext.upper()
-            if save_format in {"TIF", "TIFF"}:
-                save_format = "TIFF"
-            elif save_format not in {"PNG", "JPEG", "JPG", "BMP", "GIF"}:
-                save_format = "PNG"
-                output_name = f"{base}_cropped.png"
-            cropped.save(image_bytes, format=save_format)
-            zf.writestr(output_name, image_bytes.getvalue())
+    # Pillow releases the GIL while decoding and encoding, so entries are built on a thread pool;
+    # map keeps upload order and the zip itself is only written from this thread
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=DEFLATE_LEVEL) as zf:
+        encoded = executor.map(lambda item: _build_entry(*item, crop_box), images)
+        for output_name, save_format, payload in encoded:
+            if isinstance(payload, Image.Image):
+                # Opened by name, so the archive's ZIP_DEFLATED / DEFLATE_LEVEL settings apply
+                with zf.open(output_name, "w") as dst:
+                    payload.save(dst, format=save_format, **_SAVE_KW.get(save_format, {}))
+            else:
+                compress_type = zipfile.ZIP_STORED if save_format in STORED_FORMATS else zipfile.ZIP_DEFLATED
+                zf.writestr(output_name, payload, compress_type=compress_type)
     return buffer.getvalue()
 
 
+# Archives hold full-resolution crops, so only the current one is kept, and not for long.
+# cache_resource returns the stored bytes object itself instead of unpickling a fresh copy
+# on every hit; bytes are immutable, so sharing it between reruns and sessions is safe
+@st.cache_resource(show_spinner=False, max_entries=1, ttl=ZIP_CACHE_TTL)
+def _cached_zip(
+    key: Tuple[Tuple[str, str], ...],
+    crop_box: CropBox,
+    _images: List[Tuple[str, bytes, str]],
+) -> bytes:
+    # key (names + content digests) and the crop box identify the archive; the raw bytes aren't hashed again
+    return build_zip(_images, crop_box)
+
+
 def clamp_crop_box(box: CropBox, width: int, height: int) -> CropBox:
     left = max(0, min(box.left, width - 1))
     top = max(0, min(box.top, height - 1))
@@ -97,7 +250,10 @@ def crop_box_from_canvas(canvas_json, width: int, height: int) -> Optional[CropB
 
 
 def resize_for_canvas(image: Image.Image, max_size: int = 900) -> Image.Image:
-    display = image.copy()
+    # Integer box-filter reduce first, keeping at least 2x headroom for the LANCZOS pass to anti-alias;
+    # reduce() returns a new image, so the caller's image is only copied when no reduce applies
+    factor = max(1, max(image.size) // (max_size * 2))
+    display = image.reduce(factor) if factor > 1 else image.copy()
     display.thumbnail((max_size, max_size), Image.LANCZOS)
     return display
 
@@ -124,14 +280,12 @@ def main() -> None:
         st.warning("No valid images were loaded.")
         return
 
-    first_name, first_image = images[0]
-    width, height = first_image.size
-    display_image = resize_for_canvas(first_image)
+    first_name, first_data, first_digest = images[0]
+    display_image, (width, height) = load_preview(first_digest, first_data)
     display_width, display_height = display_image.size
     scale_x = width / display_width
     scale_y = height / display_height
 
-    ensure_streamlit_image_to_url()
     st.subheader("Crop selection")
     st.write("Draw a rectangle on the image to set the crop area.")
     canvas = st_canvas(
@@ -146,30 +300,50 @@ def main() -> None:
         key="crop_canvas",
     )
 
-    crop_box = crop_box_from_canvas(canvas.json_data, display_width, display_height)
-    if crop_box is None:
-        crop_box = CropBox(left=0, top=0, right=display_width, bottom=display_height)
-
-    crop_box = CropBox(
-        left=int(crop_box.left * scale_x),
-        top=int(crop_box.top * scale_y),
-        right=int(crop_box.right * scale_x),
-        bottom=int(crop_box.bottom * scale_y),
+    # The canvas JSON is usually unchanged between reruns; reuse the crop box derived from it
+    canvas_key = (
+        json.dumps(canvas.json_data, sort_keys=True),
+        (display_width, display_height),
+        (width, height),
     )
-    crop_box = clamp_crop_box(crop_box, width, height)
+    if st.session_state.get("last_canvas_key") == canvas_key:
+        crop_box = st.session_state["last_crop_box"]
+    else:
+        crop_box = crop_box_from_canvas(canvas.json_data, display_width, display_height)
+        if crop_box is None:
+            # Nothing drawn: the whole image, taken from the full-resolution size, since scaling the
+            # display box back up can truncate to a pixel short of the edge
+            crop_box = CropBox(left=0, top=0, right=width, bottom=height)
+        else:
+            crop_box = CropBox(
+                left=int(crop_box.left * scale_x),
+                top=int(crop_box.top * scale_y),
+                right=int(crop_box.right * scale_x),
+                bottom=int(crop_box.bottom * scale_y),
+            )
+            crop_box = clamp_crop_box(crop_box, width, height)
+        st.session_state["last_canvas_key"] = canvas_key
+        st.session_state["last_crop_box"] = crop_box
 
     st.subheader("Preview")
-    preview = crop_image(first_image, crop_box)
+    preview = preview_crop(_decode_array(first_digest, first_data), crop_box)
     st.image(preview, caption=f"Preview: {first_name}", use_column_width=True)
 
     st.subheader("Download")
-    zip_bytes = build_zip(images, crop_box)
-    st.download_button(
-        label="Download cropped images",
-        data=zip_bytes,
-        file_name="cropped_images.zip",
-        mime="application/zip",
-    )
+    # Building the archive decodes and re-encodes every upload at full resolution, so it only
+    # happens on request; a prepared archive stays offered until the uploads or crop box change
+    zip_key = tuple((name, digest) for name, _, digest in images)
+    if st.button("Prepare download"):
+        st.session_state["prepared_zip"] = (zip_key, crop_box)
+    if st.session_state.get("prepared_zip") == (zip_key, crop_box):
+        with st.spinner("Cropping images..."):
+            zip_bytes = _cached_zip(zip_key, crop_box, images)
+        st.download_button(
+            label="Download cropped images",
+            data=zip_bytes,
+            file_name="cropped_images.zip",
+            mime="application/zip",
+        )
 
 
 if __name__ == "__main__":